@@ -1,7 +1,10 @@
+import functools
 import logging
 import os
+import threading
+import time
 
-from PyQt5.QtCore import QEvent, QMetaObject, Qt, Q_ARG
+from PyQt5.QtCore import QMetaObject, Qt, Q_ARG
 from PyQt5.QtWidgets import QApplication, QMessageBox, QProgressDialog
 
 from src.models.app_settings import AppSettings, CaptureMode
@@ -16,43 +19,13 @@ from src.ui.settings_dialog import SettingsDialog
 
 logger = logging.getLogger(__name__)
 
-# Custom events for hotkey -> Qt thread communication
-_TOGGLE_EVENT = QEvent.Type(QEvent.registerEventType())
-_REGION_EVENT = QEvent.Type(QEvent.registerEventType())
-_QUIT_EVENT = QEvent.Type(QEvent.registerEventType())
+def _invoke_queued(obj, member: str):
+    """Emit a signal/slot on obj's thread from the pynput hook thread.
 
-
-class _ToggleEvent(QEvent):
-    def __init__(self):
-        super().__init__(_TOGGLE_EVENT)
-
-
-class _RegionEvent(QEvent):
-    def __init__(self):
-        super().__init__(_REGION_EVENT)
-
-
-class _QuitEvent(QEvent):
-    def __init__(self):
-        super().__init__(_QUIT_EVENT)
-
-
-class HotkeyAwareControlPanel(ControlPanel):
-    """Control panel that handles custom hotkey events from global hotkeys."""
-
-    def event(self, event):
-        if event.type() == _TOGGLE_EVENT:
-            self.toggle_requested.emit()
-            return True
-        elif event.type() == _REGION_EVENT:
-            self.region_select_requested.emit()
-            return True
-        elif event.type() == _QUIT_EVENT:
-            app = QApplication.instance()
-            if app:
-                app.quit()
-            return True
-        return super().event(event)
+    Qt marshals the queued invocation itself — no QEvent wrapper needs to
+    be allocated on the hook thread, which must return quickly.
+    """
+    QMetaObject.invokeMethod(obj, member, Qt.QueuedConnection)
 
 
 class AppController:
@@ -69,7 +42,7 @@ class AppController:
 
         # UI components
         self.overlay = OverlayWindow()
-        self.control_panel = HotkeyAwareControlPanel(
+        self.control_panel = ControlPanel(
             source_lang=self.settings.source_language,
             target_lang=self.settings.target_language,
         )
@@ -84,6 +57,10 @@ class AppController:
 
         self._connect_signals()
 
+    def _schedule_save(self):
+        """Queue a config save; ConfigManager debounces bursts."""
+        self.config_manager.save(self.settings)
+
     def _connect_signals(self):
         """Wire all signals and slots."""
         # Pipeline -> Overlay
@@ -163,7 +140,7 @@ class AppController:
         self.settings.capture_mode = CaptureMode.REGION
         self.settings.capture_region = region
         self.pipeline.update_settings(self.settings)
-        self.config_manager.save(self.settings)
+        self._schedule_save()
         logger.info("Region set to %s", region)
 
     def _on_source_changed(self, code: str):
@@ -188,7 +165,7 @@ class AppController:
         self.overlay.set_font_family(self.settings.font_family)
         self.overlay.set_overlay_opacity(self.settings.overlay_opacity)
         self.overlay.set_show_background(self.settings.show_background)
-        self.config_manager.save(self.settings)
+        self._schedule_save()
 
         # Restart hotkeys with new bindings
         self._stop_hotkeys()
@@ -214,7 +191,16 @@ class AppController:
         progress.setMinimumWidth(400)
         progress.show()
 
+        # Downloads report thousands of ticks; posting every one floods
+        # the Qt event queue, so throttle UI updates to ~20 Hz (always
+        # letting the final 100% through).
+        last_emit = [0.0]
+
         def on_progress(msg, pct):
+            now = time.monotonic()
+            if pct < 1.0 and now - last_emit[0] < 0.05:
+                return
+            last_emit[0] = now
             QMetaObject.invokeMethod(
                 progress, "setValue",
                 Qt.QueuedConnection,
@@ -226,16 +212,32 @@ class AppController:
                 Q_ARG(str, msg),
             )
 
+        # The download runs on a worker thread so the dialog stays
+        # responsive; the queued setValue/setLabelText posts above land
+        # on the main loop, which is pumped here until the worker ends
+        error: list = []
+
+        def run_download():
+            try:
+                download_model(self._model_dir, progress_callback=on_progress)
+            except Exception as e:
+                error.append(e)
+
+        worker = threading.Thread(
+            target=run_download, daemon=True, name="model-download"
+        )
+        worker.start()
         try:
-            download_model(self._model_dir, progress_callback=on_progress)
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                None, "Download Failed",
-                f"Failed to download translation model:\n{e}\n\n"
-                "Check your internet connection and try again."
-            )
-            raise
+            while worker.is_alive():
+                QApplication.processEvents()
+                worker.join(0.05)
+            if error:
+                QMessageBox.critical(
+                    None, "Download Failed",
+                    f"Failed to download translation model:\n{error[0]}\n\n"
+                    "Check your internet connection and try again."
+                )
+                raise error[0]
         finally:
             progress.close()
 
@@ -245,14 +247,14 @@ class AppController:
             from pynput import keyboard
 
             hotkeys = {
-                self.settings.hotkey_toggle: lambda: QApplication.instance().postEvent(
-                    self.control_panel, _ToggleEvent()
+                self.settings.hotkey_toggle: functools.partial(
+                    _invoke_queued, self.control_panel, "toggle_requested"
                 ),
-                self.settings.hotkey_region: lambda: QApplication.instance().postEvent(
-                    self.control_panel, _RegionEvent()
+                self.settings.hotkey_region: functools.partial(
+                    _invoke_queued, self.control_panel, "region_select_requested"
                 ),
-                self.settings.hotkey_quit: lambda: QApplication.instance().postEvent(
-                    self.control_panel, _QuitEvent()
+                self.settings.hotkey_quit: functools.partial(
+                    _invoke_queued, QApplication.instance(), "quit"
                 ),
             }
 
@@ -277,4 +279,5 @@ class AppController:
         self.control_panel.close()
         self.tray_icon.hide()
         self.config_manager.save(self.settings)
+        self.config_manager.flush()
         QApplication.instance().quit()
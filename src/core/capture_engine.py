@@ -37,6 +37,9 @@ class CaptureEngine:
         self._started = False
         # mss is thread-local — store per-thread instances
         self._local = threading.local()
+        # Reused BGR frame buffer — capture shape is stable, so this avoids
+        # a fresh W*H*3 allocation per grab
+        self._frame_buf: Optional[np.ndarray] = None
 
     def start(self, monitor: int = 0) -> None:
         """Configure the capture backend. Actual mss init is deferred to grab()."""
@@ -45,7 +48,16 @@ class CaptureEngine:
         if self._use_bettercam:
             try:
                 self._camera = bettercam.create(output_idx=monitor, output_color="BGR")
-                logger.info("BetterCam capture created for monitor %d", monitor)
+                # Run bettercam's internal capture loop: DXGI duplicates the
+                # desktop into a ring buffer at target_fps, and grab() just
+                # reads the newest frame instead of doing a DXGI handshake
+                # per call. video_mode keeps the ring buffer refreshing on
+                # every interval — without it get_latest_frame() blocks
+                # until DXGI reports a desktop change, which on a static
+                # screen (the normal steady state) hangs the capture tick
+                # indefinitely. The frame differ handles duplicates.
+                self._camera.start(target_fps=30, video_mode=True)
+                logger.info("BetterCam capture loop started for monitor %d", monitor)
                 self._started = True
                 return
             except Exception as e:
@@ -111,15 +123,29 @@ class CaptureEngine:
             return None
 
     def _grab_bettercam(self, mode: CaptureMode, region: Optional[tuple]) -> Optional[np.ndarray]:
-        if mode == CaptureMode.REGION and region:
-            x, y, w, h = region
-            frame = self._camera.grab(region=(x, y, x + w, y + h))
-        else:
-            frame = self._camera.grab()
-
+        frame = self._camera.get_latest_frame()
         if frame is None:
             return None
-        return np.array(frame)
+
+        # bettercam already hands back an ndarray — np.asarray is a no-op
+        # view then, where np.array would memcpy the whole frame
+        frame = np.asarray(frame)
+        if mode == CaptureMode.REGION and region:
+            # Zero-copy crop of the full-monitor frame. Rects can reach
+            # past the monitor edge (maximized windows report -8,-8 on
+            # Windows; regions on monitors left/above the primary go
+            # negative) and Python's negative indexing would silently
+            # wrap such a slice to the opposite edge — clamp to the
+            # frame and treat a fully off-screen rect as a failed grab
+            x, y, w, h = region
+            fh, fw = frame.shape[:2]
+            x0, y0 = max(0, x), max(0, y)
+            x1, y1 = min(fw, x + w), min(fh, y + h)
+            if x0 >= x1 or y0 >= y1:
+                logger.warning("Capture region %s lies outside the %dx%d frame", region, fw, fh)
+                return None
+            frame = frame[y0:y1, x0:x1]
+        return frame
 
     def _grab_mss(self, mode: CaptureMode, region: Optional[tuple], monitor: int) -> Optional[np.ndarray]:
         sct = self._get_mss()
@@ -133,6 +159,13 @@ class CaptureEngine:
             mon = monitors[idx]
 
         screenshot = sct.grab(mon)
-        frame = np.array(screenshot)
-        # mss returns BGRA, convert to BGR
-        return frame[:, :, :3]
+        # mss returns BGRA — wrap the raw buffer zero-copy and copy the BGR
+        # channels into a pooled buffer. The pooled copy keeps downstream
+        # frames contiguous without a fresh W*H*3 allocation per grab.
+        bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+            screenshot.height, screenshot.width, 4
+        )
+        if self._frame_buf is None or self._frame_buf.shape != bgra.shape[:2] + (3,):
+            self._frame_buf = np.empty(bgra.shape[:2] + (3,), dtype=np.uint8)
+        np.copyto(self._frame_buf, bgra[:, :, :3])
+        return self._frame_buf
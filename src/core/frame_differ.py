@@ -4,8 +4,31 @@ from typing import Optional
 import cv2
 import numpy as np
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
+# Sample grid stride for the JIT'd change test: one pixel per 8x8 tile is
+# plenty to detect UI-scale changes and reads 1/64th of the frame
+DIFF_STRIDE = 8
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _diff_strided(prev, cur, stride):
+        """Sum of absolute differences over a strided sample grid."""
+        acc = 0
+        for y in prange(0, prev.shape[0], stride):
+            row = 0
+            for x in range(0, prev.shape[1], stride):
+                d = int(prev[y, x]) - int(cur[y, x])
+                row += d if d >= 0 else -d
+            acc += row
+        return acc
+
 
 class FrameDiffer:
     """Detects whether the captured frame has changed enough to warrant re-OCR.
@@ -17,41 +40,144 @@ class FrameDiffer:
         self.threshold = threshold
         self.downsample_width = downsample_width
         self._prev_frame: Optional[np.ndarray] = None
+        # Reused across frames to avoid per-frame allocation
+        self._gray_buf: Optional[np.ndarray] = None
+        self._small_buf: Optional[np.ndarray] = None
+        # Gaussian-pyramid buffers for the /2 downsample chain, rebuilt
+        # when the input shape changes
+        self._pyr_bufs: list[np.ndarray] = []
+        self._pyr_src_shape: Optional[tuple] = None
+        # Full-res gray copy for the numba strided kernel
+        self._prev_gray: Optional[np.ndarray] = None
+        # Full-res gray of the most recent frame, reusable by callers
+        self._last_gray: Optional[np.ndarray] = None
 
     def has_changed(self, frame: np.ndarray) -> bool:
         """Check if the frame differs significantly from the previous one.
 
         Args:
-            frame: BGR numpy array
+            frame: BGR numpy array, or an already-converted gray (2-D) one
 
         Returns:
             True if frame changed or is the first frame
         """
-        # Convert to grayscale and downsample
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        h, w = gray.shape
+        # Everything downstream runs on single-channel luma — a third of
+        # the bytes of BGR, which matters since the diff is memory-bound.
+        # Callers that already hold a gray frame can pass it to skip the
+        # conversion entirely.
+        h, w = frame.shape[:2]
+        if frame.ndim == 2:
+            gray = frame
+        else:
+            if self._gray_buf is None or self._gray_buf.shape != (h, w):
+                self._gray_buf = np.empty((h, w), dtype=np.uint8)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+        self._last_gray = gray
+
+        if HAS_NUMBA:
+            # Strided-sample kernel on the full-res gray — no pyramid pass
+            # at all on unchanged frames. The thumbnail (used as the OCR
+            # cache key) is only refreshed when the frame changed.
+            changed = self._changed_strided(gray)
+            if changed:
+                thumb = self._downsample(gray) if w > self.downsample_width else gray
+                if self._prev_frame is None or self._prev_frame.shape != thumb.shape:
+                    self._prev_frame = thumb.copy()
+                else:
+                    np.copyto(self._prev_frame, thumb)
+            return changed
+
         if w > self.downsample_width:
-            scale = self.downsample_width / w
-            new_h = int(h * scale)
-            gray = cv2.resize(gray, (self.downsample_width, new_h), interpolation=cv2.INTER_AREA)
+            gray = self._downsample(gray)
 
-        if self._prev_frame is None:
-            self._prev_frame = gray
+        # Handle first frame and resolution changes
+        if self._prev_frame is None or gray.shape != self._prev_frame.shape:
+            self._prev_frame = gray.copy()
             return True
 
-        # Handle resolution changes
-        if gray.shape != self._prev_frame.shape:
-            self._prev_frame = gray
+        # Single-pass SAD on uint8 (OpenCV SIMD kernel). Everything stays
+        # uint8 end to end — compare the integer SAD total against the
+        # threshold scaled by pixel count instead of dividing per frame.
+        assert gray.dtype == np.uint8 and self._prev_frame.dtype == np.uint8
+        sad = cv2.norm(gray, self._prev_frame, cv2.NORM_L1)
+        np.copyto(self._prev_frame, gray)
+
+        changed = sad > self.threshold * gray.size
+        if not changed:
+            logger.debug("Frame unchanged (diff=%.2f, threshold=%.2f)",
+                         sad / gray.size, self.threshold)
+        return changed
+
+    def _changed_strided(self, gray: np.ndarray) -> bool:
+        """Change test via the numba SAD kernel over a sparse sample grid."""
+        if self._prev_gray is None or self._prev_gray.shape != gray.shape:
+            self._prev_gray = gray.copy()
             return True
 
-        diff = np.mean(np.abs(gray.astype(float) - self._prev_frame.astype(float)))
-        self._prev_frame = gray
+        sad = _diff_strided(self._prev_gray, gray, DIFF_STRIDE)
+        np.copyto(self._prev_gray, gray)
 
-        changed = diff > self.threshold
+        n_samples = (
+            ((gray.shape[0] + DIFF_STRIDE - 1) // DIFF_STRIDE)
+            * ((gray.shape[1] + DIFF_STRIDE - 1) // DIFF_STRIDE)
+        )
+        changed = sad > self.threshold * n_samples
         if not changed:
-            logger.debug("Frame unchanged (diff=%.2f, threshold=%.2f)", diff, self.threshold)
+            logger.debug("Frame unchanged (diff=%.2f, threshold=%.2f)",
+                         sad / n_samples, self.threshold)
         return changed
 
+    def _downsample(self, gray: np.ndarray) -> np.ndarray:
+        """Shrink gray to ~downsample_width wide.
+
+        Chains cv2.pyrDown for the power-of-2 part (OpenCV's separable
+        Gaussian kernel, noticeably faster than general INTER_AREA), then
+        resizes only the fractional residual. All buffers are reused.
+        """
+        if self._pyr_src_shape != gray.shape:
+            self._pyr_src_shape = gray.shape
+            self._pyr_bufs = []
+            h, w = gray.shape
+            while w >= self.downsample_width * 2:
+                h, w = (h + 1) // 2, (w + 1) // 2
+                self._pyr_bufs.append(np.empty((h, w), dtype=np.uint8))
+
+        for buf in self._pyr_bufs:
+            gray = cv2.pyrDown(gray, dst=buf)
+
+        h, w = gray.shape
+        if w > self.downsample_width:
+            new_h = int(h * self.downsample_width / w)
+            if self._small_buf is None or self._small_buf.shape != (new_h, self.downsample_width):
+                self._small_buf = np.empty((new_h, self.downsample_width), dtype=np.uint8)
+            gray = cv2.resize(gray, (self.downsample_width, new_h),
+                              dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        return gray
+
+    def check(self, frame: np.ndarray) -> tuple[bool, np.ndarray]:
+        """Run the change test and return (changed, gray_thumbnail).
+
+        The thumbnail is a view into the stored downsampled gray frame, so
+        callers (e.g. the OCR memoization key) reuse it without paying the
+        cvtColor+resize again. It is only valid until the next check.
+        """
+        changed = self.has_changed(frame)
+        return changed, self._prev_frame
+
+    @property
+    def last_gray(self) -> Optional[np.ndarray]:
+        """Full-resolution gray of the most recent frame, or None.
+
+        Valid until the next has_changed call (the buffer is pooled).
+        """
+        return self._last_gray
+
+    @property
+    def last_thumbnail(self) -> Optional[np.ndarray]:
+        """Downsampled gray thumbnail of the most recent frame, or None."""
+        return self._prev_frame
+
     def reset(self) -> None:
         """Reset the differ, forcing next frame to be treated as changed."""
         self._prev_frame = None
+        self._prev_gray = None
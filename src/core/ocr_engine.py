@@ -1,6 +1,10 @@
 import asyncio
+import copy
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 
 import cv2
 import numpy as np
@@ -10,17 +14,19 @@ from src.models.languages import flores_to_bcp47
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 try:
     from winrt.windows.media.ocr import OcrEngine as WinOcrEngine
     from winrt.windows.graphics.imaging import (
-        BitmapDecoder,
         BitmapPixelFormat,
         SoftwareBitmap,
     )
-    from winrt.windows.storage.streams import (
-        InMemoryRandomAccessStream,
-        DataWriter,
-    )
+    from winrt.windows.storage.streams import DataWriter
     from winrt.windows.globalization import Language
     HAS_WINRT_OCR = True
 except ImportError:
@@ -30,6 +36,67 @@ except ImportError:
 # Minimum text length to bother translating
 MIN_TEXT_LENGTH = 5
 
+# How many recent frames' OCR results to memoize
+OCR_CACHE_SIZE = 32
+
+# Frames whose longer edge exceeds this get downscaled before OCR.
+# Windows OCR accuracy plateaus well below 4K DPI, so shrinking first
+# cuts recognition time roughly with pixel count.
+OCR_MAX_EDGE = 1600
+
+# Paragraph merge tuning: lines join when the vertical gap is below
+# MERGE_GAP_FACTOR * line height and left edges align within
+# MERGE_ALIGN_FACTOR * line width
+MERGE_GAP_FACTOR = 1.5
+MERGE_ALIGN_FACTOR = 0.3
+
+def _merge_group_ids(xs, ys, ws, hs, gap_factor, align_factor):
+    """Sequential merge sweep over sorted lines, returning a group id
+    per line. Tracks the growing merged bbox exactly like the original
+    Python loop did — the gap threshold loosens as the group grows, so
+    the same page merges identically with or without numba."""
+    n = xs.shape[0]
+    gids = np.empty(n, np.int32)
+    gid = 0
+    gids[0] = 0
+    cur_x = xs[0]
+    cur_y = ys[0]
+    cur_x2 = xs[0] + ws[0]
+    cur_y2 = ys[0] + hs[0]
+    for i in range(1, n):
+        gap = ys[i] - cur_y2
+        line_h = cur_y2 - cur_y
+        x_diff = abs(xs[i] - cur_x)
+        if gap < line_h * gap_factor and x_diff < (cur_x2 - cur_x) * align_factor:
+            if xs[i] < cur_x:
+                cur_x = xs[i]
+            if xs[i] + ws[i] > cur_x2:
+                cur_x2 = xs[i] + ws[i]
+            if ys[i] + hs[i] > cur_y2:
+                cur_y2 = ys[i] + hs[i]
+        else:
+            gid += 1
+            cur_x = xs[i]
+            cur_y = ys[i]
+            cur_x2 = xs[i] + ws[i]
+            cur_y2 = ys[i] + hs[i]
+        gids[i] = gid
+    return gids
+
+if HAS_NUMBA:
+    _merge_group_ids = njit(cache=True)(_merge_group_ids)
+
+# Matches lines that are only digits/whitespace/punctuation — nothing to
+# translate. Bound method avoids the re.fullmatch dispatch per OCR line.
+_punct_only = re.compile(
+    r'[\d\s\.\,\;\:\!\?\-\—\–\|\@\#\$\%\^\&\*\(\)\[\]\{\}\/\\]+'
+).fullmatch
+
+
+def _font_size(line_height: int) -> int:
+    """Overlay font size for a detected line (floor of 8pt)."""
+    return 8 if line_height < 11 else int(line_height * 0.75)
+
 
 class OCREngine:
     """Text detection and recognition using Windows.Media.Ocr."""
@@ -38,24 +105,60 @@ class OCREngine:
         self.confidence_threshold = confidence_threshold
         self._engine = None
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
         self._current_lang = None
+        self._bgra_buf: np.ndarray | None = None
+        # Engines/Language objects per BCP-47 tag — language flip-flops
+        # skip the WinRT is_language_supported probe and engine rebuild
+        self._engine_cache: dict[str, "WinOcrEngine"] = {}
+        self._lang_cache: dict[str, "Language"] = {}
+        self._ocr_cache: OrderedDict[bytes, list[TextBlock]] = OrderedDict()
 
     def initialize(self, language: str = "en") -> None:
         """Initialize the WinRT OCR engine for the given BCP-47 language tag."""
         if not HAS_WINRT_OCR:
             raise RuntimeError("winrt OCR packages are not installed")
 
+        # Run one event loop forever on a dedicated thread so every frame's
+        # recognition reuses a warm loop instead of paying run_until_complete
+        # setup/teardown, and WinRT completions land on a stable thread.
         self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, daemon=True, name="ocr-loop"
+        )
+        self._loop_thread.start()
         self._create_engine(language)
         logger.info("OCR engine initialized (language=%s)", language)
 
+    def shutdown(self) -> None:
+        """Stop the OCR event loop thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._loop_thread is not None:
+                self._loop_thread.join(timeout=2.0)
+                self._loop_thread = None
+            self._loop.close()
+            self._loop = None
+
     def _create_engine(self, bcp47: str) -> None:
-        """Create a WinRT OcrEngine for the given BCP-47 tag."""
+        """Create (or reuse) a WinRT OcrEngine for the given BCP-47 tag."""
+        cached = self._engine_cache.get(bcp47)
+        if cached is not None:
+            self._engine = cached
+            self._current_lang = bcp47
+            logger.debug("Reusing cached OCR engine for '%s'", bcp47)
+            return
+
         try:
-            lang = Language(bcp47)
+            lang = self._lang_cache.get(bcp47)
+            if lang is None:
+                lang = Language(bcp47)
+                self._lang_cache[bcp47] = lang
             if WinOcrEngine.is_language_supported(lang):
                 self._engine = WinOcrEngine.try_create_from_language(lang)
                 self._current_lang = bcp47
+                if self._engine is not None:
+                    self._engine_cache[bcp47] = self._engine
                 logger.info("WinRT OCR engine created for '%s'", bcp47)
                 return
             else:
@@ -81,31 +184,87 @@ class OCREngine:
         if bcp47 == self._current_lang:
             return
 
+        self._ocr_cache.clear()
         self._create_engine(bcp47)
 
-    def detect(self, frame: np.ndarray, offset_x: int = 0, offset_y: int = 0) -> list[TextBlock]:
-        """Run OCR on a frame and return detected text blocks."""
+    def detect_cached(
+        self,
+        frame: np.ndarray,
+        gray_thumb: np.ndarray | None,
+        offset_x: int = 0,
+        offset_y: int = 0,
+    ) -> list[TextBlock]:
+        """Memoized detect(), keyed on a hash of the downsampled gray frame.
+
+        The thumbnail is the one FrameDiffer already computed, so the hash
+        costs almost nothing while a hit skips the entire WinRT OCR call.
+        Cached blocks are stored frame-relative; offsets are applied to
+        fresh copies on every return.
+        """
+        if gray_thumb is None:
+            return self.detect(frame, offset_x, offset_y) or []
+
+        key = hashlib.blake2b(gray_thumb.tobytes(), digest_size=8).digest()
+        cached = self._ocr_cache.get(key)
+        if cached is not None:
+            self._ocr_cache.move_to_end(key)
+            logger.debug("OCR cache hit (%d blocks)", len(cached))
+            return self._offset_copies(cached, offset_x, offset_y)
+
+        blocks = self.detect(frame)
+        if blocks is None:
+            # Failed/timed-out call, not "no text" — caching it would pin
+            # an empty result for this screen content for up to 32
+            # generations, effectively forever on a static screen
+            return []
+        self._ocr_cache[key] = blocks
+        while len(self._ocr_cache) > OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+        return self._offset_copies(blocks, offset_x, offset_y)
+
+    @staticmethod
+    def _offset_copies(blocks: list[TextBlock], dx: int, dy: int) -> list[TextBlock]:
+        """Copy blocks with an x/y offset applied, leaving the originals intact."""
+        out = []
+        for b in blocks:
+            c = copy.copy(b)
+            c.x += dx
+            c.y += dy
+            out.append(c)
+        return out
+
+    def detect(self, frame: np.ndarray, offset_x: int = 0, offset_y: int = 0) -> list[TextBlock] | None:
+        """Run OCR on a frame and return detected text blocks.
+
+        Returns None when the WinRT call fails or times out, so callers
+        (detect_cached in particular) can tell a failure apart from a
+        frame that genuinely has no text.
+        """
         if self._engine is None or self._loop is None:
             logger.error("OCR not initialized")
-            return []
+            return None
+
+        long_edge = max(frame.shape[:2])
+        scale = 1.0 if long_edge <= OCR_MAX_EDGE else OCR_MAX_EDGE / long_edge
 
         try:
-            lines = self._loop.run_until_complete(self._recognize_async(frame))
+            lines = asyncio.run_coroutine_threadsafe(
+                self._recognize_async(frame, scale), self._loop
+            ).result(timeout=5.0)
         except Exception as e:
             logger.error("OCR detection failed: %s", e)
-            return []
+            return None
 
         blocks = []
         for text, x, y, w, h in lines:
             text = text.strip()
             if not text or len(text) < MIN_TEXT_LENGTH:
                 continue
-            if re.fullmatch(r'[\d\s\.\,\;\:\!\?\-\—\–\|\@\#\$\%\^\&\*\(\)\[\]\{\}\/\\]+', text):
+            if _punct_only(text):
                 continue
             if w < 5 or h < 5:
                 continue
 
-            font_size = max(8, int(h * 0.75))
             blocks.append(TextBlock(
                 x=x + offset_x,
                 y=y + offset_y,
@@ -113,7 +272,7 @@ class OCREngine:
                 height=h,
                 text=text,
                 confidence=1.0,
-                font_size=font_size,
+                font_size=_font_size(h),
             ))
 
         # Merge vertically adjacent lines into paragraphs
@@ -129,101 +288,114 @@ class OCREngine:
         """Merge vertically adjacent lines that form a paragraph.
 
         Lines are merged when they have similar x position and the vertical
-        gap between them is small relative to line height.
+        gap between them is small relative to line height. The merge decision
+        is a sequential sweep over SoA coordinate arrays (JIT'd when numba is
+        available); TextBlocks are only constructed for the final groups.
         """
-        if len(blocks) <= 1:
+        n = len(blocks)
+        if n <= 1:
             return blocks
 
-        # Sort by y position
-        blocks.sort(key=lambda b: b.y)
+        xs = np.fromiter((b.x for b in blocks), dtype=np.int32, count=n)
+        ys = np.fromiter((b.y for b in blocks), dtype=np.int32, count=n)
+        ws = np.fromiter((b.width for b in blocks), dtype=np.int32, count=n)
+        hs = np.fromiter((b.height for b in blocks), dtype=np.int32, count=n)
 
+        # Sort by y position
+        order = np.argsort(ys, kind="stable")
+        xs, ys, ws, hs = xs[order], ys[order], ws[order], hs[order]
+
+        gids = _merge_group_ids(
+            xs, ys, ws, hs, MERGE_GAP_FACTOR, MERGE_ALIGN_FACTOR
+        )
+        starts = np.flatnonzero(np.concatenate(([1], np.diff(gids))))
+        ends = np.append(starts[1:], n)
+
+        # Merged bboxes per group via reduceat
+        g_x1 = np.minimum.reduceat(xs, starts)
+        g_y1 = ys[starts]
+        g_x2 = np.maximum.reduceat(xs + ws, starts)
+        g_y2 = np.maximum.reduceat(ys + hs, starts)
+
+        ordered = [blocks[i] for i in order]
         merged = []
-        current = blocks[0]
-
-        for next_block in blocks[1:]:
-            gap = next_block.y - (current.y + current.height)
-            line_h = current.height
-
-            # Merge if: vertical gap < 1.5x line height AND left edges align within 30% of width
-            x_diff = abs(next_block.x - current.x)
-            same_paragraph = (
-                gap < line_h * 1.5
-                and x_diff < current.width * 0.3
-            )
-
-            if same_paragraph:
-                # Merge: expand bbox, join text
-                new_x = min(current.x, next_block.x)
-                new_y = current.y
-                new_x2 = max(current.x + current.width, next_block.x + next_block.width)
-                new_y2 = next_block.y + next_block.height
-                current = TextBlock(
-                    x=new_x,
-                    y=new_y,
-                    width=new_x2 - new_x,
-                    height=new_y2 - new_y,
-                    text=current.text + " " + next_block.text,
-                    confidence=1.0,
-                    font_size=current.font_size,
-                )
-            else:
-                merged.append(current)
-                current = next_block
+        for s, e, x1, y1, x2, y2 in zip(starts, ends, g_x1, g_y1, g_x2, g_y2):
+            if e - s == 1:
+                merged.append(ordered[s])
+                continue
+            merged.append(TextBlock(
+                x=int(x1),
+                y=int(y1),
+                width=int(x2 - x1),
+                height=int(y2 - y1),
+                text=" ".join(b.text for b in ordered[s:e]),
+                confidence=1.0,
+                font_size=ordered[s].font_size,
+            ))
 
-        merged.append(current)
         return merged
 
-    async def _recognize_async(self, frame: np.ndarray) -> list[tuple[str, int, int, int, int]]:
-        """Async WinRT OCR recognition. Returns list of (text, x, y, w, h)."""
-        # Encode frame as BMP
-        success, buf = cv2.imencode('.bmp', frame)
-        if not success:
-            logger.error("Failed to encode frame as BMP")
-            return []
-
-        bmp_bytes = buf.tobytes()
-
-        # Write to InMemoryRandomAccessStream
-        stream = InMemoryRandomAccessStream()
-        writer = DataWriter(stream)
-        writer.write_bytes(bmp_bytes)
-        await writer.store_async()
-        await writer.flush_async()
-        stream.seek(0)
-
-        # Decode bitmap
-        decoder = await BitmapDecoder.create_async(stream)
-        bitmap = await decoder.get_software_bitmap_async()
+    async def _recognize_async(
+        self, frame: np.ndarray, scale: float = 1.0
+    ) -> list[tuple[str, int, int, int, int]]:
+        """Async WinRT OCR recognition. Returns list of (text, x, y, w, h).
 
-        # Convert to BGRA8 if needed (WinRT OCR requires Gray8 or BGRA8)
-        if bitmap.bitmap_pixel_format != BitmapPixelFormat.BGRA8:
-            bitmap = SoftwareBitmap.convert(bitmap, BitmapPixelFormat.BGRA8)
+        A scale < 1.0 downsamples the frame before recognition; returned
+        coordinates are mapped back to the original frame.
+        """
+        if scale < 1.0:
+            frame = cv2.resize(
+                frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA
+            )
+        h, w = frame.shape[:2]
+
+        # WinRT OCR requires Gray8 or BGRA8 — expand BGR into a reusable
+        # BGRA buffer so no per-frame allocation happens here.
+        if self._bgra_buf is None or self._bgra_buf.shape[:2] != (h, w):
+            self._bgra_buf = np.empty((h, w, 4), dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2BGRA, dst=self._bgra_buf)
+
+        # Build the SoftwareBitmap straight from the pixel buffer. This
+        # avoids the old BMP encode -> stream -> BitmapDecoder round trip,
+        # which copied megabytes per frame just to get back the pixels we
+        # already had.
+        writer = DataWriter()
+        writer.write_bytes(self._bgra_buf.tobytes())
+        bitmap = SoftwareBitmap.create_copy_from_buffer(
+            writer.detach_buffer(), BitmapPixelFormat.BGRA8, w, h
+        )
 
         # Run OCR
         result = await self._engine.recognize_async(bitmap)
 
-        # Extract lines with bounding boxes
+        # Extract lines with bounding boxes (coords back in original space)
+        inv = 1.0 / scale
         lines = []
         for line in result.lines:
             text = line.text
             if not text:
                 continue
 
-            # Compute bounding box from words
-            min_x = min(w.bounding_rect.x for w in line.words)
-            min_y = min(w.bounding_rect.y for w in line.words)
-            max_x = max(w.bounding_rect.x + w.bounding_rect.width for w in line.words)
-            max_y = max(w.bounding_rect.y + w.bounding_rect.height for w in line.words)
+            # Compute bounding box from words — one WinRT attribute walk
+            # per word instead of four generator passes
+            rects = []
+            for wd in line.words:
+                r = wd.bounding_rect
+                rects.append((r.x, r.y, r.width, r.height))
+            if not rects:
+                continue
+            rxs, rys, rws, rhs = zip(*rects)
+            min_x = min(rxs)
+            min_y = min(rys)
+            max_x = max(x + w for x, w in zip(rxs, rws))
+            max_y = max(y + h for y, h in zip(rys, rhs))
 
             lines.append((
                 text,
-                int(min_x),
-                int(min_y),
-                int(max_x - min_x),
-                int(max_y - min_y),
+                int(min_x * inv),
+                int(min_y * inv),
+                int((max_x - min_x) * inv),
+                int((max_y - min_y) * inv),
             ))
 
-        # Cleanup
-        stream.close()
-
         return lines
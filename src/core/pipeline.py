@@ -1,9 +1,15 @@
 import logging
+import queue
+import re
 import time
 import traceback
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from PyQt5.QtCore import QObject, pyqtSignal
+import cv2
+import numpy as np
+
+from PyQt5.QtCore import QMetaObject, QObject, QThread, QTimer, Qt, pyqtSignal
 
 from src.models.app_settings import AppSettings, CaptureMode
 from src.models.text_block import TextBlock
@@ -11,18 +17,25 @@ from src.core.capture_engine import CaptureEngine
 from src.core.frame_differ import FrameDiffer
 from src.core.ocr_engine import OCREngine
 from src.core.style_extractor import StyleExtractor
-from src.core.translation_engine import TranslationEngine
+from src.core.translation_engine import TranslationCoalescer, TranslationEngine
 from src.core.translation_cache import TranslationCache
 from src.models.languages import flores_to_bcp47
 
 logger = logging.getLogger(__name__)
 
+# Blocks with no linguistic content (clock readouts, percentages, lone
+# glyphs) — translating them wastes a model call and degrades the overlay
+_NOTEXT = re.compile(r'^[\s\d\W_]+$')
+
 
 class PipelineThread(QObject):
-    """Runs capture->OCR->translate on a background thread.
+    """Runs capture->OCR->translate as a three-stage queued pipeline.
 
-    Heavy work (OCR ~150ms, translate ~300ms) runs off the main thread
-    so the Qt UI stays responsive. Emits blocks_ready cross-thread via signal.
+    Heavy work runs off the main thread so the Qt UI stays responsive.
+    The stages (capture+diff+OCR, style+cache, translate) each run on
+    their own thread joined by bounded queues, so a ~300ms translate on
+    frame N overlaps OCR on frame N+1. Queues keep only the newest work
+    to preserve latency. Emits blocks_ready cross-thread via signal.
     """
 
     blocks_ready = pyqtSignal(list)
@@ -38,12 +51,20 @@ class PipelineThread(QObject):
         self.ocr = OCREngine(confidence_threshold=settings.ocr_confidence_threshold)
         self.style_extractor = StyleExtractor()
         self.translation = TranslationEngine()
+        self.coalescer = TranslationCoalescer(self.translation)
         self.cache = TranslationCache(max_size=settings.max_cache_size)
 
         self._running = False
-        self._thread: threading.Thread | None = None
+        self._threads: list[threading.Thread] = []
+        self._qthread: QThread | None = None
+        self._timer: QTimer | None = None
+        self._q_style: queue.Queue = queue.Queue(maxsize=2)
+        self._q_translate: queue.Queue = queue.Queue(maxsize=2)
         self._last_blocks: list[TextBlock] = []
         self._null_frame_count = 0
+        # 16x16 thumbnail of the previous frame for the exact-match
+        # short-circuit in _capture_cycle
+        self._prev_thumb: np.ndarray | None = None
 
     @property
     def is_running(self) -> bool:
@@ -55,8 +76,14 @@ class PipelineThread(QObject):
         bcp47 = flores_to_bcp47(src) if src != "auto" else "en"
         if bcp47 is None:
             bcp47 = "en"
-        self.ocr.initialize(language=bcp47)
-        self.translation.load(model_dir)
+        # OCR init and model load hit disjoint resources (WinRT engine
+        # setup vs NLLB weights on disk) and release the GIL in native
+        # code, so running them on two threads overlaps the cold start
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_ocr = ex.submit(self.ocr.initialize, language=bcp47)
+            f_translation = ex.submit(self.translation.load, model_dir)
+            f_ocr.result()
+            f_translation.result()
         logger.info("Pipeline engines initialized")
 
     def start(self) -> None:
@@ -64,15 +91,57 @@ class PipelineThread(QObject):
         if self._running:
             return
 
+        # Wait out the capture thread from a previous run — stop() only
+        # posts the quit, so a quick stop->start could otherwise drop the
+        # last reference to a still-running QThread and let its final
+        # tick fire into the objects created below
+        if self._qthread is not None:
+            self._qthread.quit()
+            self._qthread.wait(3000)
+            self._qthread = None
+            self._timer = None
+
+        # Same for the style/translate workers: stop() only flips
+        # _running, and their queue.get timeout gives them up to 0.2s to
+        # notice. Setting _running back to True before they exit would
+        # leave the old pair looping forever, consuming from the new
+        # queues alongside the new threads.
+        for t in self._threads:
+            if t.is_alive():
+                t.join(timeout=3.0)
+        self._threads = []
+
         # (Re)start capture with current settings
         self.capture.stop()
         self.capture.start(monitor=self.settings.capture_monitor)
         self.differ.reset()
+        self._prev_thumb = None
         self._null_frame_count = 0
 
         self._running = True
-        self._thread = threading.Thread(target=self._loop, daemon=True, name="pipeline")
-        self._thread.start()
+        self._q_style = queue.Queue(maxsize=2)
+        self._q_translate = queue.Queue(maxsize=2)
+        self._threads = [
+            threading.Thread(target=self._style_loop, daemon=True, name="pipeline-style"),
+            threading.Thread(target=self._translate_loop, daemon=True, name="pipeline-translate"),
+        ]
+        for t in self._threads:
+            t.start()
+
+        # Stage 1 is paced by a single-shot QTimer living on its own
+        # QThread: Qt reschedules through its message pump with sub-ms
+        # accuracy and stop() doesn't have to wait out a time.sleep.
+        # Thread and timer are rebuilt each start so affinity stays sane
+        # across start/stop cycles.
+        self._qthread = QThread()
+        self._qthread.setObjectName("pipeline-capture")
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.moveToThread(self._qthread)
+        # DirectConnection so the slot runs on the timer's thread, not ours
+        self._timer.timeout.connect(self._tick, Qt.DirectConnection)
+        self._qthread.started.connect(self._timer.start)
+        self._qthread.start()
         self.status_update.emit("Translation active")
         logger.info("Pipeline started (interval=%dms, monitor=%d, mode=%s)",
                     self.settings.update_interval_ms,
@@ -84,7 +153,11 @@ class PipelineThread(QObject):
         if not self._running:
             return
         self._running = False
-        # Thread will exit on next loop check
+        if self._timer is not None:
+            # Timers can only be stopped from their own thread
+            QMetaObject.invokeMethod(self._timer, "stop", Qt.QueuedConnection)
+        if self._qthread is not None:
+            self._qthread.quit()
         self.blocks_ready.emit([])
         self.status_update.emit("Translation stopped")
         logger.info("Pipeline stopped")
@@ -92,9 +165,19 @@ class PipelineThread(QObject):
     def shutdown(self) -> None:
         """Full cleanup."""
         self.stop()
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=3.0)
+        if self._qthread is not None:
+            self._qthread.wait(3000)
+            self._qthread = None
+            self._timer = None
+        for t in self._threads:
+            if t.is_alive():
+                t.join(timeout=3.0)
+        self._threads = []
         self.capture.stop()
+        self.ocr.shutdown()
+        self.style_extractor.shutdown()
+        self.coalescer.shutdown()
+        self.cache.close()
         self.translation.unload()
 
     def update_settings(self, settings: AppSettings) -> None:
@@ -120,27 +203,72 @@ class PipelineThread(QObject):
             self.capture.stop()
             self.capture.start(monitor=settings.capture_monitor)
             self.differ.reset()
+            self._prev_thumb = None
+
+    @staticmethod
+    def _put_latest(q: queue.Queue, item) -> None:
+        """Put item on a bounded queue, dropping the oldest entry if full."""
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _tick(self) -> None:
+        """Stage 1 timer slot: one capture + frame diff + OCR cycle.
+
+        Runs on the capture QThread; reschedules itself for the remainder
+        of the update interval after each cycle.
+        """
+        if not self._running:
+            return
+        # Pin the timer for the reschedule below: if a restart replaced
+        # it while this cycle ran, starting the new one from this (old)
+        # thread would be a cross-thread timer start
+        timer = self._timer
+        t0 = time.monotonic()
+        try:
+            self._capture_cycle()
+        except Exception as e:
+            logger.error("Pipeline cycle error: %s\n%s", e, traceback.format_exc())
+            self.error_occurred.emit(str(e))
+
+        if self._running and timer is not None and timer is self._timer:
+            elapsed_ms = (time.monotonic() - t0) * 1000
+            timer.start(int(max(50, self.settings.update_interval_ms - elapsed_ms)))
 
-    def _loop(self) -> None:
-        """Background thread loop: cycle + sleep."""
-        logger.info("Pipeline thread started")
+    def _style_loop(self) -> None:
+        """Stage 2 thread: style extraction + cache lookup."""
         while self._running:
-            t0 = time.monotonic()
             try:
-                self._run_cycle()
+                item = self._q_style.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            try:
+                self._style_cycle(*item)
             except Exception as e:
-                logger.error("Pipeline cycle error: %s\n%s", e, traceback.format_exc())
+                logger.error("Style stage error: %s\n%s", e, traceback.format_exc())
                 self.error_occurred.emit(str(e))
 
-            # Sleep for remaining interval
-            elapsed_ms = (time.monotonic() - t0) * 1000
-            sleep_ms = max(50, self.settings.update_interval_ms - elapsed_ms)
-            time.sleep(sleep_ms / 1000)
-
-        logger.info("Pipeline thread exited")
+    def _translate_loop(self) -> None:
+        """Stage 3 thread: translation + emit."""
+        while self._running:
+            try:
+                item = self._q_translate.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            try:
+                self._translate_cycle(*item)
+            except Exception as e:
+                logger.error("Translate stage error: %s\n%s", e, traceback.format_exc())
+                self.error_occurred.emit(str(e))
 
-    def _run_cycle(self) -> None:
-        """Execute one capture->OCR->translate cycle."""
+    def _capture_cycle(self) -> None:
+        """Execute one capture->diff->OCR step and hand off to stage 2."""
         # 1. Capture
         region = None
         offset_x, offset_y = 0, 0
@@ -173,10 +301,22 @@ class PipelineThread(QObject):
             logger.info("Capture recovered after %d null frames", self._null_frame_count)
         self._null_frame_count = 0
 
-        # 2. Frame diff — skip if unchanged
-        if not self.differ.has_changed(frame):
-            if self._last_blocks:
-                self.blocks_ready.emit(self._last_blocks)
+        # 2a. Exact-match short circuit: a 16x16 INTER_AREA thumbnail is
+        # byte-identical across frames when nothing on screen moved
+        # (paused video, idle menu) and the comparison is microseconds,
+        # so the full diff never runs on a truly static screen.
+        thumb = cv2.resize(frame, (16, 16), interpolation=cv2.INTER_AREA)
+        if self._prev_thumb is not None and np.array_equal(thumb, self._prev_thumb):
+            return
+        self._prev_thumb = thumb
+
+        # 2b. Frame diff — skip if unchanged. The gray thumbnail doubles as
+        # the OCR memoization key below.
+        # The overlay keeps showing the blocks it already holds, so
+        # unchanged frames emit nothing — re-marshalling the same list
+        # across threads every cycle bought nothing.
+        changed, gray_thumb = self.differ.check(frame)
+        if not changed:
             return
 
         # Frame changed — clear stale overlay immediately so old text
@@ -185,8 +325,11 @@ class PipelineThread(QObject):
             self._last_blocks = []
             self.blocks_ready.emit([])
 
-        # 3. OCR
-        blocks = self.ocr.detect(frame, offset_x=offset_x, offset_y=offset_y)
+        # 3. OCR (memoized on the differ's gray thumbnail — static screens
+        # that scroll back into view skip the WinRT call entirely)
+        blocks = self.ocr.detect_cached(
+            frame, gray_thumb, offset_x=offset_x, offset_y=offset_y
+        )
         if not blocks:
             self._last_blocks = []
             self.blocks_ready.emit([])
@@ -194,6 +337,19 @@ class PipelineThread(QObject):
 
         logger.info("OCR: %d blocks detected", len(blocks))
 
+        # Hand off to the style stage. The frame is copied because the
+        # capture buffer is pooled and the next grab would overwrite it
+        # while stage 2 is still sampling ROIs.
+        self._put_latest(self._q_style, (frame.copy(), blocks, offset_x, offset_y))
+
+    def _style_cycle(
+        self,
+        frame,
+        blocks: list[TextBlock],
+        offset_x: int,
+        offset_y: int,
+    ) -> None:
+        """Style extraction + cache lookup, then hand off to stage 3."""
         # 4. Style extraction (coords relative to frame)
         style_blocks = []
         for b in blocks:
@@ -211,32 +367,70 @@ class PipelineThread(QObject):
             orig.fg_color = styled.fg_color
             orig.bg_color = styled.bg_color
 
-        # 5 & 6. Translation (with cache)
+        # 5. Cache lookup
         src_lang = self.settings.source_language
         tgt_lang = self.settings.target_language
         effective_src = src_lang if src_lang != "auto" else "eng_Latn"
 
-        to_translate = []
-        translate_indices = []
+        # Unique text -> block indices: repeated UI chrome (duplicated
+        # labels, two subtitle columns) is translated once and fanned out
+        to_translate: dict[str, list[int]] = {}
 
+        if effective_src == tgt_lang:
+            # Nothing to translate — copy text straight through
+            for block in blocks:
+                block.translation = block.text
+            self._put_latest(self._q_translate, (blocks, {}, effective_src, tgt_lang))
+            return
+
+        skipped = 0
         for i, block in enumerate(blocks):
+            if len(block.text.strip()) < 2 or _NOTEXT.match(block.text):
+                block.translation = block.text
+                skipped += 1
+                continue
             cached = self.cache.get(block.text, effective_src, tgt_lang)
             if cached is not None:
                 block.translation = cached
             else:
-                to_translate.append(block.text)
-                translate_indices.append(i)
+                to_translate.setdefault(block.text, []).append(i)
+
+        if skipped:
+            logger.debug("Skipped %d non-linguistic blocks", skipped)
 
+        self._put_latest(
+            self._q_translate,
+            (blocks, to_translate, effective_src, tgt_lang),
+        )
+
+    def _translate_cycle(
+        self,
+        blocks: list[TextBlock],
+        to_translate: dict[str, list[int]],
+        effective_src: str,
+        tgt_lang: str,
+    ) -> None:
+        """Translate uncached texts and emit the finished blocks."""
+        # 6. Translation — unique texts only, submitted through the
+        # coalescer so texts from back-to-back frames share one batched
+        # generate call, then fanned out to every block with that text
         if to_translate:
-            logger.info("Translating %d texts (%s -> %s)", len(to_translate), effective_src, tgt_lang)
-            translations = self.translation.translate_batch(
-                to_translate,
-                source_lang=effective_src,
-                target_lang=tgt_lang,
-            )
-            for idx, trans in zip(translate_indices, translations):
-                blocks[idx].translation = trans
-                self.cache.put(blocks[idx].text, effective_src, tgt_lang, trans)
+            logger.info("Translating %d unique texts (%s -> %s)",
+                        len(to_translate), effective_src, tgt_lang)
+            futures = [
+                self.coalescer.submit(text, effective_src, tgt_lang)
+                for text in to_translate
+            ]
+            for (text, indices), fut in zip(to_translate.items(), futures):
+                try:
+                    trans = fut.result(timeout=10.0)
+                except Exception as e:
+                    logger.warning("Translation timed out/failed for %r: %s", text[:40], e)
+                    trans = text
+                else:
+                    self.cache.put(text, effective_src, tgt_lang, trans)
+                for idx in indices:
+                    blocks[idx].translation = trans
             logger.info("Translation complete")
 
         # 7. Emit to overlay
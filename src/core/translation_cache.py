@@ -1,48 +1,171 @@
+import hashlib
 import logging
+import sqlite3
+import threading
+import time
 from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DB_PATH = "translation_cache.db"
+
+# Entries older than this are purged on startup
+TTL_SECONDS = 30 * 24 * 3600
+
+# Disk writes are batched to amortize fsync cost
+WRITE_BATCH = 100
+
+# In-memory shard count (power of two). Independent shards with their own
+# locks keep the pipeline's style and translate threads from contending.
+N_SHARDS = 8
+
 
 class TranslationCache:
-    """LRU cache for translations, keyed by (text, source_lang, target_lang)."""
+    """LRU cache for translations, keyed by (text, source_lang, target_lang).
 
-    def __init__(self, max_size: int = 500):
+    Hot entries live in sharded in-memory OrderedDicts keyed by a 64-bit
+    hash; misses fall through to a SQLite backing store so translations
+    survive restarts and warm-start instantly.
+    """
+
+    def __init__(self, max_size: int = 500, db_path: str | None = DEFAULT_DB_PATH):
         self.max_size = max_size
-        self._cache: OrderedDict[tuple, str] = OrderedDict()
+        self._shards: list[OrderedDict[int, str]] = [
+            OrderedDict() for _ in range(N_SHARDS)
+        ]
+        self._locks = [threading.Lock() for _ in range(N_SHARDS)]
         self._hits = 0
         self._misses = 0
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self._pending: list[tuple] = []
+
+        if db_path:
+            try:
+                self._db = sqlite3.connect(
+                    db_path, check_same_thread=False, isolation_level=None
+                )
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS cache("
+                    "h INTEGER PRIMARY KEY, src TEXT, tgt TEXT, "
+                    "text TEXT, trans TEXT, ts INTEGER)"
+                )
+                self._db.execute(
+                    "DELETE FROM cache WHERE ts < ?",
+                    (int(time.time()) - TTL_SECONDS,),
+                )
+            except Exception as e:
+                logger.warning("Translation cache DB unavailable: %s", e)
+                self._db = None
+
+    @staticmethod
+    def _hash(text: str, source_lang: str, target_lang: str) -> int:
+        digest = hashlib.blake2b(
+            f"{source_lang}\0{target_lang}\0{text}".encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big", signed=True)
 
     def get(self, text: str, source_lang: str, target_lang: str) -> str | None:
         """Look up a cached translation.
 
         Returns translated text or None if not cached.
         """
-        key = (text, source_lang, target_lang)
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            self._hits += 1
-            return self._cache[key]
+        k = hash(f"{source_lang}\0{target_lang}\0{text}")
+        s = k & (N_SHARDS - 1)
+        shard = self._shards[s]
+        with self._locks[s]:
+            value = shard.get(k)
+            if value is not None:
+                shard.move_to_end(k)
+                self._hits += 1
+                return value
+
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    row = self._db.execute(
+                        "SELECT trans FROM cache WHERE h = ?",
+                        (self._hash(text, source_lang, target_lang),),
+                    ).fetchone()
+            except Exception as e:
+                logger.debug("Cache DB read failed: %s", e)
+                row = None
+            if row is not None:
+                # Promote to the in-memory front
+                with self._locks[s]:
+                    shard[k] = row[0]
+                    self._trim(s)
+                self._hits += 1
+                return row[0]
+
         self._misses += 1
         return None
 
     def put(self, text: str, source_lang: str, target_lang: str, translation: str) -> None:
         """Store a translation in the cache."""
-        key = (text, source_lang, target_lang)
-        self._cache[key] = translation
-        self._cache.move_to_end(key)
-        while len(self._cache) > self.max_size:
-            self._cache.popitem(last=False)
+        k = hash(f"{source_lang}\0{target_lang}\0{text}")
+        s = k & (N_SHARDS - 1)
+        with self._locks[s]:
+            shard = self._shards[s]
+            shard[k] = translation
+            shard.move_to_end(k)
+            self._trim(s)
+
+        if self._db is not None:
+            self._pending.append((
+                self._hash(text, source_lang, target_lang),
+                source_lang, target_lang, text, translation, int(time.time()),
+            ))
+            if len(self._pending) >= WRITE_BATCH:
+                self._flush()
+
+    def _trim(self, shard_idx: int) -> None:
+        """Evict oldest entries of one shard past its share of max_size.
+
+        Caller must hold the shard lock.
+        """
+        shard = self._shards[shard_idx]
+        per_shard = max(1, self.max_size // N_SHARDS)
+        while len(shard) > per_shard:
+            shard.popitem(last=False)
+
+    def _flush(self) -> None:
+        """Write pending entries to SQLite in one batch."""
+        if self._db is None or not self._pending:
+            return
+        try:
+            with self._db_lock:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                    self._pending,
+                )
+        except Exception as e:
+            logger.debug("Cache DB write failed: %s", e)
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Flush pending writes and close the backing store."""
+        self._flush()
+        if self._db is not None:
+            try:
+                self._db.close()
+            except Exception:
+                pass
+            self._db = None
 
     def clear(self) -> None:
-        """Clear all cached translations."""
-        self._cache.clear()
+        """Clear all in-memory cached translations."""
+        for s_idx in range(N_SHARDS):
+            with self._locks[s_idx]:
+                self._shards[s_idx].clear()
         self._hits = 0
         self._misses = 0
 
     @property
     def size(self) -> int:
-        return len(self._cache)
+        return sum(len(shard) for shard in self._shards)
 
     @property
     def hit_rate(self) -> float:
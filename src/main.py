@@ -32,8 +32,9 @@ def main():
     logger.info("Starting Screen Translator...")
 
     import signal
-    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtWidgets import QApplication, QSplashScreen
     from PyQt5.QtCore import Qt, QTimer
+    from PyQt5.QtGui import QColor, QPixmap
 
     # High-DPI support
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
@@ -50,10 +51,29 @@ def main():
     _keepalive.timeout.connect(lambda: None)
     _keepalive.start(200)
 
-    from src.app import AppController
+    # Show a splash before the heavy imports: AppController transitively
+    # pulls in cv2 and the translation stack, which takes seconds — defer
+    # that to the event loop so the window appears immediately.
+    pixmap = QPixmap(360, 120)
+    pixmap.fill(QColor(30, 30, 30))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "Loading Screen Translator...", Qt.AlignCenter, QColor(220, 220, 220)
+    )
+    splash.show()
+    app.processEvents()
+
+    holder = {}
+
+    def _finish_startup():
+        from src.app import AppController
+
+        controller = AppController()
+        holder["controller"] = controller
+        controller.start()
+        splash.finish(controller.control_panel)
 
-    controller = AppController()
-    controller.start()
+    QTimer.singleShot(0, _finish_startup)
 
     sys.exit(app.exec_())
 
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class TextBlock:
+    """A detected text region with its translation and display style.
+
+    Coordinates are in screen pixels (global or frame-relative depending
+    on context). slots=True keeps per-block allocation cheap — many of
+    these are created per frame.
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+    text: str
+    confidence: float = 1.0
+    font_size: int = 14
+    translation: Optional[str] = None
+    fg_color: tuple[int, int, int] = (255, 255, 255)
+    bg_color: tuple[int, int, int] = (0, 0, 0)
+
+    @property
+    def display_text(self) -> str:
+        """Text to render on the overlay: translation if available, else source."""
+        return self.translation if self.translation else self.text
@@ -1,8 +1,11 @@
 import logging
 import ctypes
+from functools import lru_cache
 
 from PyQt5.QtCore import Qt, QRect
-from PyQt5.QtGui import QPainter, QColor, QFont, QFontMetrics
+from PyQt5.QtGui import (
+    QPainter, QColor, QFont, QFontMetrics, QPixmap, QStaticText, QTransform,
+)
 from PyQt5.QtWidgets import QWidget, QApplication
 
 from src.models.text_block import TextBlock
@@ -24,6 +27,20 @@ except Exception:
     HAS_WIN32 = False
 
 
+@lru_cache(maxsize=4096)
+def _measure(family: str, size: int, width: int, text: str) -> tuple[int, int]:
+    """Word-wrapped bounding size of text at the given font and width.
+
+    boundingRect is the most expensive Qt call in the paint loop and its
+    inputs repeat across shrink steps and repaints (translated lines
+    persist for many frames), so memoizing it skips Qt text layout
+    entirely on the steady state.
+    """
+    metrics = QFontMetrics(QFont(family, size))
+    br = metrics.boundingRect(QRect(0, 0, width, 10000), Qt.TextWordWrap, text)
+    return br.width(), br.height()
+
+
 def _virtual_geometry() -> QRect:
     """Get the bounding rect of all monitors (virtual desktop)."""
     screen = QApplication.primaryScreen()
@@ -41,12 +58,36 @@ class OverlayWindow(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._blocks: list[TextBlock] = []
+        # Precomputed per-block layout (font, rects); rebuilt only when
+        # the blocks or font change, not on every expose repaint
+        self._layouts: list[tuple] = []
+        # Rendered scene, blitted on repaints that carry no data change
+        # (restacking, exposes); invalidated whenever appearance changes
+        self._cache_pixmap: QPixmap | None = None
+        # bg_color tuple -> QColor with the overlay alpha premixed;
+        # cleared when the opacity changes
+        self._bg_color_cache: dict[tuple, QColor] = {}
+        # fg_color tuple -> QColor; the OCR palette is tiny, so these
+        # caches stay at a handful of entries
+        self._fg_color_cache: dict[tuple, QColor] = {}
+        # (text, size, width) -> QStaticText with the shaped glyph runs
+        # cached, so redraws blit glyphs instead of re-running layout and
+        # shaping; cleared wholesale if translations churn it too large
+        self._static_text_cache: dict[tuple, QStaticText] = {}
         self._font_family = "Arial"
         self._overlay_opacity = 0.9
         self._show_background = True
         self._visible = False
         self._vg_offset_x = 0  # Virtual geometry x offset (can be negative)
         self._vg_offset_y = 0
+        # The Win32 style/affinity calls and setGeometry only need to run
+        # again when the monitor layout changes, not on every show cycle
+        self._click_through_applied = False
+        self._last_vg: QRect | None = None
+        # size -> (QFont, QFontMetrics). Fonts are immutable once built,
+        # so one pair per pixel size serves every block and repaint;
+        # rebuilding them per shrink step dominated paint time.
+        self._font_cache: dict[int, tuple[QFont, QFontMetrics]] = {}
 
         self._setup_window()
 
@@ -67,16 +108,34 @@ class OverlayWindow(QWidget):
         self._apply_click_through()
         self.hide()
 
+        # Re-apply window state when the monitor layout changes
+        app = QApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self._on_screens_changed)
+            app.screenRemoved.connect(self._on_screens_changed)
+
+    def _on_screens_changed(self, *_):
+        """Monitor layout changed — geometry and styles must be redone."""
+        self._click_through_applied = False
+        self._update_geometry()
+        if self._visible:
+            self._apply_click_through()
+        self._layouts = self._compute_layouts()
+        self._cache_pixmap = None
+        self.update()
+
     def _update_geometry(self):
         """Set geometry to cover the full virtual desktop."""
         vg = _virtual_geometry()
-        self.setGeometry(vg)
+        if vg != self._last_vg:
+            self.setGeometry(vg)
+            self._last_vg = QRect(vg)
         self._vg_offset_x = vg.x()
         self._vg_offset_y = vg.y()
 
     def _apply_click_through(self):
         """Set Win32 extended styles for full click-through and exclude from capture."""
-        if not HAS_WIN32:
+        if not HAS_WIN32 or self._click_through_applied:
             return
         try:
             hwnd = int(self.winId())
@@ -91,17 +150,35 @@ class OverlayWindow(QWidget):
                 logger.debug("Overlay excluded from screen capture")
 
             logger.debug("Click-through applied to overlay")
+            self._click_through_applied = True
         except Exception as e:
             logger.error("Failed to set click-through: %s", e)
 
     def set_font_family(self, family: str):
         self._font_family = family
+        self._font_cache.clear()
+        self._static_text_cache.clear()
+        self._layouts = self._compute_layouts()
+        self._cache_pixmap = None
+        self.update()
+
+    def _get_font(self, size: int) -> tuple[QFont, QFontMetrics]:
+        """Font + metrics for the current family at size, cached."""
+        cached = self._font_cache.get(size)
+        if cached is None:
+            font = QFont(self._font_family, size)
+            cached = (font, QFontMetrics(font))
+            self._font_cache[size] = cached
+        return cached
 
     def set_overlay_opacity(self, opacity: float):
         self._overlay_opacity = max(0.0, min(1.0, opacity))
+        self._bg_color_cache.clear()
+        self._cache_pixmap = None
 
     def set_show_background(self, show: bool):
         self._show_background = show
+        self._cache_pixmap = None
 
     def update_blocks(self, blocks: list[TextBlock]):
         """Update the text blocks to render and trigger repaint."""
@@ -114,32 +191,27 @@ class OverlayWindow(QWidget):
         elif not blocks and self._visible:
             self.hide()
             self._visible = False
+        # Layout (truncation, font fitting, rects) happens here, once per
+        # data change — paintEvent also fires on expose/damage and those
+        # repaints become pure draw work
+        self._layouts = self._compute_layouts()
+        self._cache_pixmap = None
         self.update()
 
     def clear(self):
         """Clear all blocks and hide overlay."""
         self._blocks = []
+        self._layouts = []
+        self._cache_pixmap = None
         self.hide()
         self._visible = False
 
-    def paintEvent(self, event):
-        """Render translated text blocks with background rectangles.
-
-        Two-pass rendering: all backgrounds first, then all text.
-        This prevents text from one block overlapping another's background.
-        """
-        if not self._blocks:
-            return
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.setRenderHint(QPainter.TextAntialiasing, True)
-
+    def _compute_layouts(self) -> list[tuple]:
+        """Build the per-block layout list for paintEvent to draw."""
         # Global screen coords -> widget-local coords offset
         ox = self._vg_offset_x
         oy = self._vg_offset_y
 
-        # Pre-compute layout for each block
         layouts = []
         for block in self._blocks:
             if not block.display_text:
@@ -156,47 +228,133 @@ class OverlayWindow(QWidget):
 
             # Start with OCR-detected font size, then shrink to fit
             font_size = max(8, min(block.font_size, 48))
-            font = QFont(self._font_family, font_size)
-            metrics = QFontMetrics(font)
-
-            measure_rect = QRect(0, 0, block.width, 10000)
-            br = metrics.boundingRect(measure_rect, Qt.TextWordWrap, display)
-
-            # Shrink font until text fits in the block height
-            while font_size > 8 and br.height() > block.height + 4:
-                font_size -= 1
-                font = QFont(self._font_family, font_size)
-                metrics = QFontMetrics(font)
-                br = metrics.boundingRect(measure_rect, Qt.TextWordWrap, display)
+            text_h = _measure(self._font_family, font_size, block.width, display)[1]
+
+            # Binary-search the largest size that fits: wrapped height is
+            # monotonic in font size, so ~log2(range) measurements replace
+            # the old one-point-at-a-time walk
+            if text_h > block.height + 4:
+                lo, hi = 8, font_size - 1
+                font_size = 8
+                while lo <= hi:
+                    mid = (lo + hi) // 2
+                    h = _measure(self._font_family, mid, block.width, display)[1]
+                    if h <= block.height + 4:
+                        font_size = mid
+                        lo = mid + 1
+                    else:
+                        hi = mid - 1
+                text_h = _measure(self._font_family, font_size, block.width, display)[1]
+
+            font, _ = self._get_font(font_size)
 
             # Scale padding with font size
             pad = max(4, font_size // 5)
 
-            text_rect = QRect(local_x, local_y, block.width, max(block.height, br.height()))
+            text_rect = QRect(local_x, local_y, block.width, max(block.height, text_h))
             bg_rect = QRect(
                 local_x - pad, local_y - pad,
-                block.width + pad * 2, max(block.height, br.height()) + pad * 2,
+                block.width + pad * 2, max(block.height, text_h) + pad * 2,
             )
 
-            layouts.append((block, display, font, font_size, text_rect, bg_rect, pad))
+            key = (display, font_size, block.width)
+            static = self._static_text_cache.get(key)
+            if static is None:
+                if len(self._static_text_cache) > 512:
+                    self._static_text_cache.clear()
+                static = QStaticText(display)
+                static.setTextFormat(Qt.PlainText)
+                static.setTextWidth(block.width)
+                static.prepare(QTransform(), font)
+                self._static_text_cache[key] = static
+
+            layouts.append((block, static, font, font_size, text_rect, bg_rect, pad))
+
+        return layouts
+
+    def paintEvent(self, event):
+        """Blit the cached scene, rendering it first if invalidated.
+
+        The scene only changes when blocks or appearance settings do, so
+        repaints triggered by restacking/expose are a single pixmap blit
+        of the damaged rect.
+        """
+        if not self._layouts:
+            return
+
+        if self._cache_pixmap is None:
+            dpr = self.devicePixelRatioF()
+            pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            self._render_scene(painter)
+            painter.end()
+            self._cache_pixmap = pixmap
+
+        painter = QPainter(self)
+        rect = event.rect()
+        # The source rect is in raw pixmap pixels, so the logical damage
+        # rect must be scaled by the device pixel ratio — passing it
+        # as-is would stretch the top-left 1/dpr² of the scene over the
+        # damaged area on scaled displays
+        dpr = self._cache_pixmap.devicePixelRatio()
+        src = QRect(
+            int(rect.x() * dpr), int(rect.y() * dpr),
+            int(rect.width() * dpr), int(rect.height() * dpr),
+        )
+        painter.drawPixmap(rect, self._cache_pixmap, src)
+        painter.end()
+
+    def _render_scene(self, painter: QPainter) -> None:
+        """Render translated text blocks with background rectangles.
+
+        Two-pass rendering: all backgrounds first, then all text.
+        This prevents text from one block overlapping another's background.
+        """
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setRenderHint(QPainter.TextAntialiasing, True)
+
+        # QPainter state changes dirty internal engine state, so brushes,
+        # pens and fonts are only reconfigured when the value actually
+        # differs from the previous block — OCR blocks from one panel
+        # typically share colors and sizes.
 
         # --- Pass 1: Draw all backgrounds ---
         if self._show_background:
             painter.setPen(Qt.NoPen)
-            for block, display, font, font_size, text_rect, bg_rect, pad in layouts:
-                bg = QColor(*block.bg_color)
-                bg.setAlphaF(self._overlay_opacity)
-                painter.setBrush(bg)
+            last_bg = None
+            for block, static, font, font_size, text_rect, bg_rect, pad in self._layouts:
+                if block.bg_color != last_bg:
+                    bg = self._bg_color_cache.get(block.bg_color)
+                    if bg is None:
+                        bg = QColor(*block.bg_color)
+                        bg.setAlphaF(self._overlay_opacity)
+                        self._bg_color_cache[block.bg_color] = bg
+                    painter.setBrush(bg)
+                    last_bg = block.bg_color
                 painter.drawRoundedRect(bg_rect, 3, 3)
 
         # --- Pass 2: Draw all text with clipping ---
-        for block, display, font, font_size, text_rect, bg_rect, pad in layouts:
-            painter.setFont(font)
-            fg = QColor(*block.fg_color)
-            painter.setPen(fg)
-            painter.save()
-            painter.setClipRect(bg_rect)
-            painter.drawText(text_rect, Qt.TextWordWrap | Qt.AlignTop, display)
-            painter.restore()
-
-        painter.end()
+        last_fg = None
+        last_size = None
+        for block, static, font, font_size, text_rect, bg_rect, pad in self._layouts:
+            if font_size != last_size:
+                painter.setFont(font)
+                last_size = font_size
+            if block.fg_color != last_fg:
+                fg = self._fg_color_cache.get(block.fg_color)
+                if fg is None:
+                    fg = QColor(*block.fg_color)
+                    self._fg_color_cache[block.fg_color] = fg
+                painter.setPen(fg)
+                last_fg = block.fg_color
+            # bg_rect is text_rect inflated by pad, so the clip is a
+            # no-op in practice — skip the save/restore of the full
+            # painter state stack that guarded it
+            if bg_rect.contains(text_rect):
+                painter.drawStaticText(text_rect.topLeft(), static)
+            else:
+                painter.setClipRect(bg_rect)
+                painter.drawStaticText(text_rect.topLeft(), static)
+                painter.setClipping(False)
@@ -9,10 +9,26 @@ from PyQt5.QtWidgets import (
 
 from src.models.app_settings import AppSettings, CaptureMode
 from src.models.languages import get_all_languages, get_flores_code
-from src.utils.window_utils import get_visible_windows
+from src.utils.window_utils import get_visible_window_titles, invalidate_window_cache
 
 logger = logging.getLogger(__name__)
 
+# (name, flores_code) pairs for the language combos. Built lazily once —
+# resolving the code per name per combo per dialog was ~2N lookups every
+# time the dialog opened.
+_lang_items: list = None
+
+
+def _get_lang_items() -> list:
+    global _lang_items
+    if _lang_items is None:
+        _lang_items = [
+            (name, code)
+            for name in get_all_languages()
+            if (code := get_flores_code(name))
+        ]
+    return _lang_items
+
 
 class SettingsDialog(QDialog):
     """Tabbed settings dialog for all app configuration."""
@@ -39,19 +55,17 @@ class SettingsDialog(QDialog):
         lang_tab = QWidget()
         lang_layout = QFormLayout(lang_tab)
 
+        lang_items = _get_lang_items()
+
         self.combo_source = QComboBox()
         self.combo_source.addItem("Auto Detect", "auto")
-        for name in get_all_languages():
-            code = get_flores_code(name)
-            if code:
-                self.combo_source.addItem(name, code)
+        for name, code in lang_items:
+            self.combo_source.addItem(name, code)
         lang_layout.addRow("Source Language:", self.combo_source)
 
         self.combo_target = QComboBox()
-        for name in get_all_languages():
-            code = get_flores_code(name)
-            if code:
-                self.combo_target.addItem(name, code)
+        for name, code in lang_items:
+            self.combo_target.addItem(name, code)
         lang_layout.addRow("Target Language:", self.combo_target)
 
         self.tabs.addTab(lang_tab, "Language")
@@ -171,10 +185,19 @@ class SettingsDialog(QDialog):
         btn_layout.addWidget(btn_cancel)
         layout.addLayout(btn_layout)
 
+        # value -> index per data-carrying combo, so _set_combo_data does
+        # one dict lookup instead of an itemData round trip per entry
+        # (~200 for the language combos)
+        self._combo_index = {
+            combo: {combo.itemData(i): i for i in range(combo.count())}
+            for combo in (self.combo_source, self.combo_target, self.combo_capture_mode)
+        }
+
     def _refresh_windows(self):
         self.combo_window.clear()
-        for w in get_visible_windows():
-            self.combo_window.addItem(w["title"])
+        # The user asked for a refresh — bypass the enumeration TTL
+        invalidate_window_cache()
+        self.combo_window.addItems(get_visible_window_titles())
 
     def _load_settings(self):
         s = self.settings
@@ -238,7 +261,6 @@ class SettingsDialog(QDialog):
         self.accept()
 
     def _set_combo_data(self, combo: QComboBox, value):
-        for i in range(combo.count()):
-            if combo.itemData(i) == value:
-                combo.setCurrentIndex(i)
-                return
+        idx = self._combo_index[combo].get(value)
+        if idx is not None:
+            combo.setCurrentIndex(idx)
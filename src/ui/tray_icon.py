@@ -1,5 +1,5 @@
 import logging
-import os
+from pathlib import Path
 
 from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtGui import QIcon
@@ -7,7 +7,7 @@ from PyQt5.QtWidgets import QSystemTrayIcon, QMenu, QAction
 
 logger = logging.getLogger(__name__)
 
-ICON_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "assets", "icon.png")
+ICON_PATH = str(Path(__file__).resolve().parents[2] / "assets" / "icon.png")
 
 
 class TrayIcon(QSystemTrayIcon):
@@ -23,15 +23,16 @@ class TrayIcon(QSystemTrayIcon):
         super().__init__(parent)
         self._is_running = False
 
-        # Set icon
-        if os.path.exists(ICON_PATH):
-            self.setIcon(QIcon(ICON_PATH))
-        else:
+        # Set icon — QIcon resolves the path itself (and would go through
+        # the resource system if the icon moves into a qrc), so no
+        # separate existence syscall is needed
+        icon = QIcon(ICON_PATH)
+        if icon.isNull():
             # Use a default Qt icon
             from PyQt5.QtWidgets import QApplication
-            self.setIcon(QApplication.style().standardIcon(
-                QApplication.style().SP_ComputerIcon
-            ))
+            style = QApplication.style()
+            icon = style.standardIcon(style.SP_ComputerIcon)
+        self.setIcon(icon)
 
         self.setToolTip("Screen Translator")
 
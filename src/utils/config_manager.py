@@ -1,19 +1,40 @@
 import os
 import logging
+import threading
+
 import yaml
 
+try:
+    # C-backed loader/dumper are several times faster than the pure-Python
+    # ones; fall back when PyYAML was built without libyaml
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 from src.models.app_settings import AppSettings
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_CONFIG_PATH = "config.yaml"
 
+# Rapid saves (slider drags, batch updates) within this window collapse
+# into a single disk write
+SAVE_DEBOUNCE_S = 0.5
+
 
 class ConfigManager:
-    """Loads and saves AppSettings to a YAML config file."""
+    """Loads and saves AppSettings to a YAML config file.
+
+    Saves are debounced: save() stores the settings and arms a short
+    timer, so bursts of changes cost one write, off the GUI thread.
+    Call flush() on shutdown to persist anything still pending.
+    """
 
     def __init__(self, config_path: str = DEFAULT_CONFIG_PATH):
         self.config_path = config_path
+        self._lock = threading.Lock()
+        self._pending: AppSettings | None = None
+        self._timer: threading.Timer | None = None
 
     def load(self) -> AppSettings:
         """Load settings from YAML file. Returns defaults if file doesn't exist."""
@@ -22,7 +43,7 @@ class ConfigManager:
             return AppSettings()
         try:
             with open(self.config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_Loader)
             if data is None:
                 return AppSettings()
             return AppSettings.from_dict(data)
@@ -31,10 +52,33 @@ class ConfigManager:
             return AppSettings()
 
     def save(self, settings: AppSettings) -> None:
-        """Save settings to YAML file."""
+        """Schedule a debounced save of the given settings."""
+        with self._lock:
+            self._pending = settings
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(SAVE_DEBOUNCE_S, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        """Write any pending settings immediately."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._flush()
+
+    def _flush(self) -> None:
+        with self._lock:
+            settings = self._pending
+            self._pending = None
+        if settings is None:
+            return
         try:
             with open(self.config_path, "w", encoding="utf-8") as f:
-                yaml.dump(settings.to_dict(), f, default_flow_style=False, allow_unicode=True)
+                yaml.dump(settings.to_dict(), f, Dumper=_Dumper,
+                          default_flow_style=False, allow_unicode=True)
             logger.info("Config saved to %s", self.config_path)
         except Exception as e:
             logger.error("Failed to save config: %s", e)
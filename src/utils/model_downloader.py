@@ -1,19 +1,56 @@
 import logging
+import os
+
+try:
+    # Rust-backed transfer backend; opt in only when it is installed,
+    # since enabling the env var without it makes hub downloads fail
+    import hf_transfer  # noqa: F401
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+except ImportError:
+    pass
+
+try:
+    from huggingface_hub import try_to_load_from_cache
+    try:
+        from huggingface_hub import _CACHED_NO_EXIST
+    except ImportError:
+        from huggingface_hub.file_download import _CACHED_NO_EXIST
+    HAS_HF_HUB = True
+except Exception:
+    HAS_HF_HUB = False
+    _CACHED_NO_EXIST = None
 
 logger = logging.getLogger(__name__)
 
 MODEL_NAME = "facebook/nllb-200-distilled-600M"
 
+# Once the model is seen in the cache it can't un-download mid-session;
+# memoize so repeat callers skip the cache scan
+_model_downloaded = False
+
+# Only the files transformers actually loads — skips flax/tf weight
+# variants that roughly double the bytes transferred
+ALLOW_PATTERNS = ["*.json", "*.model", "*.bin", "*.safetensors", "tokenizer*"]
+
 
 def is_model_downloaded(model_dir: str) -> bool:
     """Check if the NLLB model is available in HuggingFace cache."""
+    global _model_downloaded
+    if _model_downloaded:
+        return True
+    if not HAS_HF_HUB:
+        return False
     try:
-        from huggingface_hub import try_to_load_from_cache
-        # Check if the main config file is cached
+        # Check if the main config file is cached. The hub returns a
+        # sentinel (not None) when a commit record says the file is
+        # explicitly absent — only a real path string counts.
         result = try_to_load_from_cache(MODEL_NAME, "config.json")
-        return result is not None and isinstance(result, str)
+        if result is _CACHED_NO_EXIST or not isinstance(result, str):
+            return False
     except Exception:
         return False
+    _model_downloaded = True
+    return True
 
 
 def download_model(model_dir: str, progress_callback=None) -> None:
@@ -33,7 +70,11 @@ def download_model(model_dir: str, progress_callback=None) -> None:
     report("Downloading NLLB-200 600M translation model...", 0.0)
 
     try:
-        snapshot_download(repo_id=MODEL_NAME)
+        snapshot_download(
+            repo_id=MODEL_NAME,
+            max_workers=8,
+            allow_patterns=ALLOW_PATTERNS,
+        )
         report("Model download complete!", 1.0)
     except Exception as e:
         logger.error("Model download failed: %s", e)
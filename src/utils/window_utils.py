@@ -1,4 +1,5 @@
 import logging
+import time
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -12,15 +13,38 @@ except ImportError:
     logger.warning("pywin32 not available, window capture disabled")
 
 
-def get_visible_windows() -> list[dict]:
-    """Return list of visible windows with titles and rects.
+# Enumeration results are cached briefly: a full EnumWindows plus
+# per-hwnd Win32 calls is fine on a button click but would dominate the
+# capture cycle if it ran on every translation tick in window mode
+_ENUM_TTL_S = 0.5
+_enum_cache: list[tuple] = []
+_enum_time = 0.0
+_title_cache: list[str] = []
+_title_time = 0.0
 
-    Each dict: {"hwnd": int, "title": str, "rect": (x, y, w, h)}
+
+def invalidate_window_cache() -> None:
+    """Force the next enumeration call to hit Win32 again."""
+    global _enum_time, _title_time
+    _enum_time = 0.0
+    _title_time = 0.0
+
+
+def get_visible_windows() -> list[tuple]:
+    """Return list of visible windows as (hwnd, title, x, y, w, h) tuples.
+
+    Results are cached for a short TTL; call invalidate_window_cache()
+    to force a fresh enumeration.
     """
+    global _enum_cache, _enum_time
     if not HAS_WIN32:
         return []
 
-    windows = []
+    now = time.monotonic()
+    if now - _enum_time < _ENUM_TTL_S:
+        return _enum_cache
+
+    windows: list[tuple] = []
 
     def callback(hwnd, _):
         if not win32gui.IsWindowVisible(hwnd):
@@ -29,15 +53,10 @@ def get_visible_windows() -> list[dict]:
         if not title:
             return
         try:
-            rect = win32gui.GetWindowRect(hwnd)
-            x, y, x2, y2 = rect
+            x, y, x2, y2 = win32gui.GetWindowRect(hwnd)
             w, h = x2 - x, y2 - y
             if w > 0 and h > 0:
-                windows.append({
-                    "hwnd": hwnd,
-                    "title": title,
-                    "rect": (x, y, w, h),
-                })
+                windows.append((hwnd, title, x, y, w, h))
         except Exception:
             pass
 
@@ -46,9 +65,44 @@ def get_visible_windows() -> list[dict]:
     except Exception as e:
         logger.error("Failed to enumerate windows: %s", e)
 
+    _enum_cache = windows
+    _enum_time = now
     return windows
 
 
+def get_visible_window_titles() -> list[str]:
+    """Return just the titles of visible windows.
+
+    Skips GetWindowRect entirely — half the Win32 calls of the full
+    enumeration, which is all the settings combo box needs.
+    """
+    global _title_cache, _title_time
+    if not HAS_WIN32:
+        return []
+
+    now = time.monotonic()
+    if now - _title_time < _ENUM_TTL_S:
+        return _title_cache
+
+    titles: list[str] = []
+
+    def callback(hwnd, _):
+        if not win32gui.IsWindowVisible(hwnd):
+            return
+        title = win32gui.GetWindowText(hwnd)
+        if title:
+            titles.append(title)
+
+    try:
+        win32gui.EnumWindows(callback, None)
+    except Exception as e:
+        logger.error("Failed to enumerate windows: %s", e)
+
+    _title_cache = titles
+    _title_time = now
+    return titles
+
+
 def get_window_rect(hwnd: int) -> Optional[tuple]:
     """Get (x, y, w, h) for a window handle."""
     if not HAS_WIN32:
@@ -63,11 +117,27 @@ def get_window_rect(hwnd: int) -> Optional[tuple]:
 
 
 def find_window_by_title(title: str) -> Optional[int]:
-    """Find a window handle by partial title match."""
+    """Find a window handle by partial title match.
+
+    Enumerates directly with title checks only — no rect fetches, and
+    the per-window work stops once a match is found.
+    """
     if not HAS_WIN32:
         return None
-    windows = get_visible_windows()
-    for w in windows:
-        if title.lower() in w["title"].lower():
-            return w["hwnd"]
-    return None
+
+    needle = title.lower()
+    found: list[int] = []
+
+    def callback(hwnd, _):
+        if found or not win32gui.IsWindowVisible(hwnd):
+            return
+        text = win32gui.GetWindowText(hwnd)
+        if text and needle in text.lower():
+            found.append(hwnd)
+
+    try:
+        win32gui.EnumWindows(callback, None)
+    except Exception as e:
+        logger.error("Failed to enumerate windows: %s", e)
+
+    return found[0] if found else None